@@ -1,26 +1,141 @@
 import logging
-from abc import ABC, abstractmethod
-from dataclasses import dataclass, field
+from dataclasses import MISSING, dataclass, field, fields
 from enum import Enum
-from typing import ClassVar, List, Tuple
+from functools import lru_cache
+from itertools import groupby
+from operator import itemgetter
+from typing import ClassVar, Iterable, Iterator, List, Tuple
 
-from dacite import from_dict
-from reportlab.lib import colors
-from reportlab.lib.colors import HexColor
+# only the lightweight constant modules of reportlab are imported here,
+# the flowables, styles and colors are imported when the document is rendered
 from reportlab.lib.enums import TA_LEFT, TA_CENTER, TA_RIGHT
 from reportlab.lib.pagesizes import A2 as RL_A2
 from reportlab.lib.pagesizes import A3 as RL_A3
 from reportlab.lib.pagesizes import A4 as RL_A4
-from reportlab.lib.styles import ParagraphStyle
 from reportlab.lib.units import inch
-from reportlab.platypus import Image as RL_Image
-from reportlab.platypus import PageBreak as RL_PageBreak
-from reportlab.platypus import Paragraph as RL_Paragraph, Spacer
-from reportlab.platypus import Table as RL_Table
 
 
-@dataclass
-class PDFObject(ABC):
+_get_row = itemgetter("row")  # the cells of a table row
+
+
+@lru_cache(maxsize=256)
+def _hex_color(color: str):
+    """Parses the hex color string, cells of a table tend to share a handful of colors"""
+    from reportlab.lib.colors import HexColor  # pylint: disable=import-outside-toplevel
+
+    return HexColor(color)
+
+
+@lru_cache(maxsize=256)
+def _paragraph_style(name: str, alignment: int, size: int, font: str):
+    """Returns a shared paragraph style, styles are reusable between flowables"""
+    from reportlab.lib.styles import ParagraphStyle  # pylint: disable=import-outside-toplevel
+
+    return ParagraphStyle(name=name, alignment=alignment, fontSize=size, fontName=font)
+
+
+@lru_cache(maxsize=32)
+def _table_style_rules(header: bool, grid: bool, border: bool) -> Tuple:
+    """Returns the table-wide style commands, these only depend on the options of the table"""
+    from reportlab.lib import colors  # pylint: disable=import-outside-toplevel
+
+    rules = []
+
+    if header:
+        rules.append(("LINEBELOW", (0, 0), (-1, 0), 1, colors.black))  # add a line below the first row
+        rules.append(("BACKGROUND", (0, 0), (-1, -0), colors.lightgrey))  # add grey background
+
+    if grid:
+        rules.append(("GRID", (0, 0), (-1, -1), 0.25, colors.grey))
+
+    if border:
+        rules.append(("BOX", (0, 0), (-1, -1), 0.5, colors.black))
+
+    return tuple(rules)
+
+
+@lru_cache(maxsize=32)
+def _shared_table_style(font: str, header: bool, grid: bool, border: bool):
+    """Returns a shared style for tables without per-cell styling, setStyle does not modify it"""
+    from reportlab.platypus import TableStyle  # pylint: disable=import-outside-toplevel
+
+    return TableStyle([("FONTNAME", (0, 0), (-1, -1), font), *_table_style_rules(header, grid, border)])
+
+
+def fast_from_dict(cls=None, *, name: str = "from_yaml", skip: Tuple[str, ...] = ()):
+    """Class decorator that generates a straight-line ``from_yaml`` for a data class
+
+    The fields are inspected once, when the class is decorated, and the generated
+    method reads the known keys directly from the dictionary instead of reflecting
+    over the data class on every call, passing them to ``__init__`` positionally.
+    Fields whose type defines ``from_yaml`` are loaded with it, references to the
+    abstract ``PDFObject`` (the parent) are not yaml attributes and keep their default.
+
+    Args:
+        name (str): The name of the generated class method
+        skip (Tuple[str, ...]): Fields left to their defaults, for the class to load itself
+    """
+    if cls is None:
+        return lambda cls: fast_from_dict(cls, name=name, skip=skip)
+
+    namespace = {}
+    arguments = []
+    keyword_arguments = []  # kw_only fields, passed after all the positional ones
+
+    for data_field in fields(cls):
+        if not data_field.init:
+            continue
+
+        field_name = data_field.name
+
+        if field_name in skip or data_field.type is PDFObject:  # the parent is set by the owner
+            value = None
+
+        elif hasattr(data_field.type, "from_yaml"):  # nested object
+            namespace[f"_load_{field_name}"] = data_field.type.from_yaml
+            value = f"_load_{field_name}(yaml_like[{field_name!r}])"
+
+        else:
+            value = f"yaml_like[{field_name!r}]"
+
+        if data_field.default is not MISSING:
+            namespace[f"_default_{field_name}"] = data_field.default
+            default = f"_default_{field_name}"
+
+        elif data_field.default_factory is not MISSING:
+            namespace[f"_factory_{field_name}"] = data_field.default_factory
+            default = f"_factory_{field_name}()"
+
+        else:
+            default = None
+
+        if value is None:  # skipped
+            value = default
+
+        elif default is not None:
+            value = f"{value} if {field_name!r} in yaml_like else {default}"
+
+        if data_field.kw_only:
+            keyword_arguments.append(f"{field_name}={value}")
+
+        else:
+            arguments.append(value)
+
+    source = "def from_yaml(cls, yaml_like):\n    return cls(" + ", ".join(arguments + keyword_arguments) + ")\n"
+    exec(source, namespace)  # pylint: disable=exec-used
+
+    from_yaml = namespace["from_yaml"]
+    from_yaml.__name__ = name
+    from_yaml.__qualname__ = f"{cls.__qualname__}.{name}"
+    from_yaml.__doc__ = PDFObject.from_yaml.__doc__
+
+    setattr(cls, name, classmethod(from_yaml))
+
+    return cls
+
+
+@dataclass(slots=True)
+class PDFObject:
     """Base class of every object on a pdf page"""
 
     key: ClassVar[str]
@@ -33,12 +148,13 @@ class PDFObject(ABC):
         CENTER = "center"
 
     @classmethod
-    @abstractmethod
     def from_yaml(cls, yaml_like: dict):
         """Attempts to load the object from a yaml-like structured dictionary object"""
+        raise NotImplementedError
 
 
-@dataclass
+@fast_from_dict
+@dataclass(slots=True)
 class Margin(PDFObject):
     """This class stores the global margins on a page"""
 
@@ -49,12 +165,9 @@ class Margin(PDFObject):
     top: int = field(default=16)
     bottom: int = field(default=16)
 
-    @classmethod
-    def from_yaml(cls, yaml_like: dict):
-        pass
-
 
-@dataclass
+@fast_from_dict
+@dataclass(slots=True)
 class Sheet(PDFObject):
     """This class describes the sheet properties of a pdf document"""
 
@@ -67,26 +180,20 @@ class Sheet(PDFObject):
         A3 = RL_A3
         A2 = RL_A2
 
-    margin: Margin = field(default=Margin())
+    _SIZE_MAP: ClassVar[dict] = {element.name: element.value for element in Size}
+
+    margin: Margin = field(default_factory=Margin)
     size: str = field(default="A4")
     font: str = field(default="Times-Roman")
 
-    @classmethod
-    def from_yaml(cls, yaml_like: dict):
-        return from_dict(data_class=cls, data=yaml_like)
-
     @property
     def size_tuple(self) -> Tuple[float, float]:
         """Returns the raw size value as a tuple of floats"""
-        for element in Sheet.Size:
-            if element.name == self.size:
-                return element.value
-
-        return -1, -1
+        return Sheet._SIZE_MAP.get(self.size, (-1, -1))
 
 
-@dataclass
-class Renderable(PDFObject, ABC):
+@dataclass(slots=True)
+class Renderable(PDFObject):
     """Base class for all renderable PDF objects"""
 
     parent: PDFObject = field(default=None)
@@ -94,28 +201,32 @@ class Renderable(PDFObject, ABC):
     space_before: int = field(default=4)
     space_after: int = field(default=4)
 
-    def render(self, flowable_list: List):
-        """This method renders the contents of the list
+    def render(self) -> Iterator:
+        """Renders the object, yielding its flowables
 
-        Args:
-            flowable_list (List): The list of flowables to append itself to
+        Objects placed directly on the page are surrounded by their vertical spacing.
         """
-        if isinstance(self.parent, PDF):
-            flowable_list.append(Spacer(width=0, height=self.space_before))
+        from reportlab.platypus import Spacer  # pylint: disable=import-outside-toplevel
 
-            self.generate(flowable_list)
+        if not isinstance(self.parent, PDF):
+            yield from self.generate()
+            return
 
-            flowable_list.append(Spacer(width=0, height=self.space_after))
+        # spacers are not pooled: reportlab detects layout loops by flowable identity,
+        # a shared instance at the top of a page is reported as too large
+        yield Spacer(width=0, height=self.space_before)
 
-        else:
-            self.generate(flowable_list)
+        yield from self.generate()
 
-    @abstractmethod
-    def generate(self, flowable_list: List):
-        """Appends the object as a flowable to the page's flowable list"""
+        yield Spacer(width=0, height=self.space_after)
 
+    def generate(self) -> Iterator:
+        """Yields the object as flowables for the page"""
+        raise NotImplementedError
 
-@dataclass
+
+@fast_from_dict
+@dataclass(slots=True)
 class Paragraph(Renderable):
     """A paragraph is a simple PDF element that stores text"""
 
@@ -123,55 +234,50 @@ class Paragraph(Renderable):
 
     font: ClassVar[str] = field(default="Times-Roman")
 
+    _RL_ALIGN: ClassVar[dict] = {
+        PDFObject.Alignment.LEFT.value: TA_LEFT,
+        PDFObject.Alignment.CENTER.value: TA_CENTER,
+        PDFObject.Alignment.RIGHT.value: TA_RIGHT,
+    }
+
     alignment: str = field(default=PDFObject.Alignment.LEFT.value)
     size: int = field(default=12)
 
     text: str = field(default="")
 
+    _rl_alignment: int = field(default=TA_LEFT, init=False, repr=False, compare=False)
+
     def __post_init__(self):
         self.space_before = self.size // 3  # set default margins
+        self._rl_alignment = Paragraph._RL_ALIGN.get(self.alignment, TA_LEFT)
 
-    @classmethod
-    def from_yaml(cls, yaml_like: dict):
-        return from_dict(data_class=cls, data=yaml_like)
-
-    def generate(self, flowable_list: List):
-        # create the paragraph style
-        style = ParagraphStyle(
-            name=self.alignment,
-            alignment=self.rl_alignment,
-            fontSize=self.size,
-            fontName=Paragraph.font,
-        )
-        flowable_list.append(RL_Paragraph(self.text, style))
+    def generate(self) -> Iterator:
+        from reportlab.platypus import Paragraph as RL_Paragraph  # pylint: disable=import-outside-toplevel
 
-    @property
-    def rl_alignment(self):
-        """Returns the reportlab equivalent of the alignment value"""
-        if self.alignment == Paragraph.Alignment.LEFT.value:
-            return TA_LEFT
+        yield self._flowable(RL_Paragraph, Paragraph.font)
 
-        if self.alignment == Paragraph.Alignment.CENTER.value:
-            return TA_CENTER
+    def _flowable(self, rl_paragraph_cls: type, font: str):
+        """Builds the reportlab paragraph, shared with the batched rendering in PDF.render"""
+        # get the (cached) paragraph style
+        style = _paragraph_style(self.alignment, self._rl_alignment, self.size, font)
+        return rl_paragraph_cls(self.text, style)
 
-        if self.alignment == Paragraph.Alignment.RIGHT.value:
-            return TA_RIGHT
+    @property
+    def rl_alignment(self):
+        """Returns the reportlab equivalent of the alignment value (resolved at construction)"""
+        return self._rl_alignment
 
 
-@dataclass
+@fast_from_dict(name="_from_fields", skip=("rows",))
+@dataclass(slots=True)
 class Table(Renderable):
     """Class to define a table"""
 
     key = "table"
     font: ClassVar[str] = field(default="Times-Roman")
 
-    @dataclass
-    class Row:
-        """Class to define a row in the table"""
-
-        resource: str = field(default="")
-
-    @dataclass
+    @fast_from_dict
+    @dataclass(slots=True)
     class Cell(PDFObject):
         """Class to define a sigle cell in the table"""
 
@@ -180,9 +286,7 @@ class Table(Renderable):
         text: str = field(default="")
         background_color: str = field(default="0xFFFFFF")
 
-        @classmethod
-        def from_yaml(cls, yaml_like: dict):
-            return from_dict(data_class=cls, data=yaml_like)
+        parent: PDFObject = field(default=None, repr=False)
 
     border: bool = field(default=False)
     header: bool = field(default=False)  # if true, the first row is the header
@@ -191,88 +295,89 @@ class Table(Renderable):
 
     @classmethod
     def from_yaml(cls, yaml_like: dict):
-        result = from_dict(data_class=cls, data=yaml_like)  # get the non-nested fields
-        result.rows = []  # override rows
+        result = cls._from_fields(yaml_like)  # get the non-nested fields
 
         rows = yaml_like.get("rows")
 
-        assert isinstance(rows, list)
+        # validate the structure once, the rows themselves are trusted
+        if not isinstance(rows, list):
+            raise TypeError(f"The rows of a table must be a list, got: {type(rows)}")
 
-        for row in rows:  # get the dictionary of a row
-            assert isinstance(row, dict)
-            cols = row.get("row")  # get the list of dictionaries from the row
+        # bind the per-cell lookups to locals once
+        cell_key, cell_from_yaml = Table.Cell.key, Table.Cell.from_yaml
+        image_key, image_from_yaml = Image.key, Image.from_yaml
 
-            assert isinstance(cols, list)
-            row = []
+        def load_element(col: dict) -> PDFObject:
+            """Loads one element of a row, either a cell or an image"""
+            if cell_key in col:
+                element = cell_from_yaml(col[cell_key] or {})  # an empty cell has no attributes
 
-            for col in cols:
-                assert isinstance(col, dict)
-                resource = col.get(Table.Cell.key)
+            else:
+                image = col[image_key]
 
-                if resource is not None:
-                    cell = Table.Cell.from_yaml(resource)
-                    cell.parent = result
-                    row.append(cell)
-                    continue
+                if not isinstance(image, dict):
+                    raise TypeError(f"The image of a table row must be a dictionary, got: {type(image)}")
 
-                resource = col.get(Image.key)
+                element = image_from_yaml(image)
 
-                if resource is not None:
-                    assert isinstance(resource, dict)
-                    img = Image.from_yaml(resource)
-                    img.parent = result
-                    img.generate(row)
-                    continue
+            element.parent = result
+            return element
 
-            result.rows.append(row)
+        # override rows, an empty image has no resource and is skipped
+        result.rows = [
+            [load_element(col) for col in cols if cell_key in col or col.get(image_key) is not None]
+            for cols in map(_get_row, rows)  # the list of dictionaries of each row
+        ]
 
         return result
 
-    def generate(self, flowable_list: List):
+    def generate(self) -> Iterator:
+        from reportlab.platypus import Table as RL_Table  # pylint: disable=import-outside-toplevel
+
         table_data = []
-        background_colors = []
+        cell_style_args = []
 
-        for i, row in enumerate(self.rows):
-            background_colors.append([])
-            table_data.append([])
-            for cell in row:
-                if isinstance(cell, Table.Cell):
-                    background_colors[i].append(cell.background_color)
-                    table_data[i].append(cell.text)
+        # bind the per-cell lookups to locals once
+        cell_cls = Table.Cell
+        append_style = cell_style_args.append
 
-                else:
-                    table_data[i].append(cell)
+        for i, row in enumerate(self.rows):
+            row_data = []
+            append_data = row_data.append
 
-        table = RL_Table(table_data)
+            for j, cell in enumerate(row):
+                if isinstance(cell, cell_cls):
+                    append_data(cell.text)
 
-        style_args = [("FONTNAME", (0, 0), (-1, -1), self.font)]
+                    # set background color
+                    if cell.background_color != "0xFFFFFF":
+                        append_style(("BACKGROUND", (j, i), (j, i), _hex_color(cell.background_color)))
 
-        # set background colors
-        for i, row in enumerate(background_colors):
-            for j, color in enumerate(row):
-                if color != "0xFFFFFF":
-                    style_args.append(("BACKGROUND", (j, i), (j, i), HexColor(color)))
+                else:
+                    append_data(list(cell.render()))  # the flowables of the image
 
-        if self.header:
-            style_args.append(
-                ("LINEBELOW", (0, 0), (-1, 0), 1, colors.black)
-            )  # add a line below the first row
-            style_args.append(
-                ("BACKGROUND", (0, 0), (-1, -0), colors.lightgrey)
-            )  # add grey background
+            table_data.append(row_data)
 
-        if self.grid:
-            style_args.append(("GRID", (0, 0), (-1, -1), 0.25, colors.grey))
+        table = RL_Table(table_data)
 
-        if self.border:
-            style_args.append(("BOX", (0, 0), (-1, -1), 0.5, colors.black))
+        if cell_style_args:
+            # the table-wide rules come last so the header background overrides the cell colors
+            table.setStyle(
+                [
+                    ("FONTNAME", (0, 0), (-1, -1), self.font),
+                    *cell_style_args,
+                    *_table_style_rules(self.header, self.grid, self.border),
+                ]
+            )
 
-        table.setStyle(style_args)
+        else:
+            table.setStyle(_shared_table_style(self.font, self.header, self.grid, self.border))
 
-        flowable_list.append(table)
+        yield table
 
 
-@dataclass
+@fast_from_dict
+@dataclass(slots=True)
 class Image(Renderable):
     """Class to store and display images"""
 
@@ -283,18 +388,16 @@ class Image(Renderable):
     width: int = field(default=1 * inch)
     height: int = field(default=1 * inch)
 
-    @classmethod
-    def from_yaml(cls, yaml_like: dict):
-        return from_dict(data_class=cls, data=yaml_like)
+    def generate(self) -> Iterator:
+        from reportlab.platypus import Image as RL_Image  # pylint: disable=import-outside-toplevel
 
-    def generate(self, flowable_list: List):
         img = RL_Image(self.resource, self.width, self.height)
         img.hAlign = self.alignment.upper()
 
-        flowable_list.append(img)
+        yield img
 
 
-@dataclass
+@dataclass(slots=True)
 class PageBreak(Renderable):
     """Class to define a page break in the document"""
 
@@ -304,17 +407,27 @@ class PageBreak(Renderable):
     def from_yaml(cls, yaml_like: dict):
         return cls()
 
-    def generate(self, flowable_list: List):
-        flowable_list.append(RL_PageBreak())
+    def render(self) -> Iterator:
+        """Renders the page break without the vertical spacing around it"""
+        return self.generate()
 
+    def generate(self) -> Iterator:
+        from reportlab.platypus import PageBreak as RL_PageBreak  # pylint: disable=import-outside-toplevel
 
-@dataclass
+        yield RL_PageBreak()
+
+
+# the renderable elements that can appear in the content list, by their yaml key
+_CONTENT_TYPES = {element_cls.key: element_cls for element_cls in (Paragraph, Table, Image, PageBreak)}
+
+
+@dataclass(slots=True)
 class PDF(PDFObject):
     """Container class to organize all PDF objects into one structure"""
 
     key = "pdf"
 
-    sheet: Sheet = field(default=Sheet())
+    sheet: Sheet = field(default_factory=Sheet)
 
     content: List = field(default_factory=list)
 
@@ -335,76 +448,66 @@ class PDF(PDFObject):
             #   - sheet
             #   - content
             #
-            if key == cls.sheet.key:
+            if key == Sheet.key:
                 result.sheet = Sheet.from_yaml(value)
 
             elif key == "content":
                 assert isinstance(value, list)  # content must be a list of dicts
 
-                for dictionary in value:
-
-                    # region Paragraph
-                    element = dictionary.get(Paragraph.key)
-
-                    if element is not None:
-                        para = Paragraph.from_yaml(element)
-                        para.parent = result
-                        result.content.append(para)
-                        continue
-
-                    # endregion
-
-                    # region Table
-
-                    element = dictionary.get(Table.key)
-
-                    if element is not None:
-                        table = Table.from_yaml(element)
-                        table.parent = result
-                        result.content.append(table)
-                        continue
-
-                    # endregion
+                # bind the per-element lookups to locals once
+                get_content_type = _CONTENT_TYPES.get
+                append_content = result.content.append
 
-                    # region Image
-
-                    element = dictionary.get(Image.key)
-
-                    if element is not None:
-                        i = Image.from_yaml(element)
-                        i.parent = result
-                        result.content.append(i)
-                        continue
-
-                    # endregion
-
-                    # region Page Break
-
-                    try:
-                        dictionary[PageBreak.key]
+                for dictionary in value:
+                    for element_key, element in dictionary.items():
+                        element_cls = get_content_type(element_key)
 
-                    except KeyError:
-                        pass
+                        # only a page break has no attributes, other empty elements are invalid
+                        if element_cls is not None and (element is not None or element_cls is PageBreak):
+                            obj = element_cls.from_yaml(element)
+                            obj.parent = result
+                            append_content(obj)
+                            break
 
                     else:
-                        result.content.append(PageBreak())
-
-                    # endregion
-
-                    logging.warning("Invalid yaml element: %s", dictionary)
+                        logging.warning("Invalid yaml element: %s", dictionary)
 
         return result
 
-    def render(self) -> List:
-        """Renders the contents of the PDF object"""
+    def render(self) -> Iterator:
+        """Renders the contents of the PDF object, yielding the flowables in order"""
         Paragraph.font = self.sheet.font
         Table.font = self.sheet.font
 
-        content = []
-
-        for element in self.content:
-            assert isinstance(element, Renderable)
-
-            element.render(content)
-
-        return content
+        def is_page_paragraph(element) -> bool:
+            """Subclasses may override the rendering, so only plain paragraphs are batched"""
+            return type(element) is Paragraph and element.parent is self  # pylint: disable=unidiomatic-typecheck
+
+        # consecutive paragraphs placed on the page are rendered in one batch
+        for is_paragraph, elements in groupby(self.content, key=is_page_paragraph):
+            if is_paragraph:
+                yield from PDF._render_paragraph_run(elements)
+                continue
+
+            for element in elements:
+                yield from element.render()
+
+    @staticmethod
+    def _render_paragraph_run(paragraphs: Iterable[Paragraph]) -> List:
+        """Renders a run of paragraphs placed on the page, each surrounded by its spacing"""
+        # pylint: disable=import-outside-toplevel
+        from reportlab.platypus import Paragraph as RL_Paragraph
+        from reportlab.platypus import Spacer
+
+        # pylint: disable=protected-access
+        font = Paragraph.font
+
+        return [
+            flowable
+            for paragraph in paragraphs
+            for flowable in (
+                Spacer(width=0, height=paragraph.space_before),
+                paragraph._flowable(RL_Paragraph, font),
+                Spacer(width=0, height=paragraph.space_after),
+            )
+        ]
@@ -1,7 +1,5 @@
 import logging
 
-from reportlab.platypus import SimpleDocTemplate
-
 from .pdf.objects import PDF
 
 
@@ -10,6 +8,9 @@ def render(file_name: str, pdf: PDF) -> bool:
 
     The rendering is done using reportlab's platypus module
     """
+    # platypus is heavy to import, only load it when a document is actually rendered
+    from reportlab.platypus import SimpleDocTemplate  # pylint: disable=import-outside-toplevel
+
     doc = SimpleDocTemplate(
         file_name,
         pagesize=pdf.sheet.size_tuple,
@@ -19,7 +20,7 @@ def render(file_name: str, pdf: PDF) -> bool:
         bottomMargin=pdf.sheet.margin.bottom,
     )
 
-    content = pdf.render()
+    content = list(pdf.render())  # build consumes the story as a list
 
     try:
         doc.build(content)
@@ -1,13 +1,22 @@
-import io
 import logging
 from os import getcwd
 import sys
 import re
+from typing import IO, Union
 
-from yaml import safe_load
+from yaml import load
+
+try:
+    from yaml import CSafeLoader as _Loader  # libyaml bindings
+except ImportError:
+    from yaml import SafeLoader as _Loader
 
 from .pdf.objects import PDF
 
+_VARIABLE_PATTERN = re.compile(r"<(\w+)>")  # <variable> placeholder, the group is the name
+# a placeholder with spaces or hyphens in its name, e.g. <serial number>, paragraph markup is not matched
+_INVALID_VARIABLE_PATTERN = re.compile(r"<\w+[ -][\w -]*>")  # a single class after the separator, linear matching
+
 
 def init(yaml_path: str):
     """Loads the yaml file"""
@@ -15,16 +24,38 @@ def init(yaml_path: str):
         with open(yaml_path, "r", encoding="utf-8") as file:
             init.yaml_raw = file.read()
 
+        _yaml_tokens()  # split the file once, up front
+
     except FileNotFoundError:
         logging.fatal("Yam`l file not found at: %s.", yaml_path)
         logging.fatal("Current working directory is: %s", getcwd())
         sys.exit(1)
 
 
+def _yaml_tokens():
+    """Returns the loaded yaml file split at its variables, or None if no file is loaded
+
+    The literal text is at the even, the variable names at the odd indices. The split is
+    redone if ``init.yaml_raw`` was replaced since, e.g. when it is assigned directly.
+    """
+    raw = getattr(init, "yaml_raw", None)
+
+    if raw is None:
+        return None
+
+    if getattr(init, "yaml_tokens_source", None) is not raw:
+        init.yaml_tokens = _VARIABLE_PATTERN.split(raw)
+        init.yaml_tokens_source = raw
+
+    return init.yaml_tokens
+
+
 def load_variables(variables: dict) -> dict:
     """Loads the variable dictionary back into the raw file"""
 
-    if not hasattr(init, "yaml_raw"):
+    tokens = _yaml_tokens()
+
+    if tokens is None:
         logging.warning(
             "%s: yaml file not loaded, please use the %s method first",
             load_variables.__name__,
@@ -32,33 +63,42 @@ def load_variables(variables: dict) -> dict:
         )
         return None
 
-    string = init.yaml_raw
+    # fill the placeholders of the pre-split file, no regex is run here
+    parts = tokens[:]
+    found = set()
+    not_overridden = []
 
-    for name, value in variables.items():
-        name_str = f"<{name}>"
+    for i in range(1, len(parts), 2):
+        name = parts[i]
 
-        previous_string = string
+        if name in variables:
+            found.add(name)
+            parts[i] = str(variables[name])
 
-        string = re.sub(name_str, value, string)
+        else:
+            parts[i] = f"<{name}>"  # leave the placeholder as is
+            not_overridden.append(parts[i])
 
-        if string == previous_string:
-            logging.warning("Variable '%s' not found in yaml file", name)
+    string = "".join(parts)
 
-    matches = has_variables(string)
+    for name in variables:
+        if name not in found:
+            logging.warning("Variable '%s' not found in yaml file", name)
 
-    if matches:
-        # the list is not None, not all variables were filled
-        for match in matches:
-            logging.warning("Variable '%s' was not overridden", match)
+    # not all variables were filled
+    for match in not_overridden:
+        logging.warning("Variable '%s' was not overridden", match)
 
-    return safe_load(string)  # convert the string back to dict
+    return load(string, Loader=_Loader)  # convert the string back to dict
 
 
 def has_variables(string: str = ""):
     """Checks if the yaml file has variables with the <variable> syntax"""
 
     if not string:
-        if not hasattr(init, "yaml_raw"):
+        tokens = _yaml_tokens()
+
+        if tokens is None:
             logging.warning(
                 "%s: yaml file not loaded, please use the %s method first",
                 load_variables.__name__,
@@ -66,11 +106,9 @@ def has_variables(string: str = ""):
             )
             return False
 
-        string = init.yaml_raw
-
-    re_pattern = r"<\w+>"
+        return [f"<{name}>" for name in tokens[1::2]]
 
-    return re.findall(re_pattern, string)
+    return [match.group(0) for match in _VARIABLE_PATTERN.finditer(string)]
 
 
 def check_yaml_syntax():
@@ -84,9 +122,7 @@ def check_yaml_syntax():
         )
         return
 
-    re_pattern = r"<\w+^>"
-
-    errors = re.findall(pattern=re_pattern, string=init.yaml_raw)
+    errors = _INVALID_VARIABLE_PATTERN.findall(init.yaml_raw)
 
     if errors:
         for error in errors:
@@ -96,18 +132,22 @@ def check_yaml_syntax():
         logging.info("Yaml variable syntax is correct")
 
 
-def parse(file: str or io.TextIOWrapper):
+def parse(file: Union[str, IO]):
     """Parses the file and generates a PDF object from it
-    :param file: the input file. Can be a string of the file path or an already opened file stream
+    :param file: the input file. Can be a string of the file path or an already opened (text or binary) stream
     :returns: a PDF object
-    :raises TypeError: if the input is neither a file nor a file path string
+    :raises TypeError: if the input is neither a readable stream nor a file path string
+
+    The stream is handed to the loader as is, so it is read in chunks instead of being
+    loaded into a string first. Files opened by path are read as bytes, which lets
+    libyaml do the (UTF-8 by default) decoding itself.
     """
     if isinstance(file, str):
-        with open(file, "r", encoding="utf-8") as f_open:
-            yaml_content = safe_load(f_open)
+        with open(file, "rb") as f_open:
+            yaml_content = load(f_open, Loader=_Loader)
 
-    elif isinstance(file, io.TextIOWrapper):
-        yaml_content = safe_load(file)
+    elif hasattr(file, "read"):
+        yaml_content = load(file, Loader=_Loader)
 
     else:
         raise TypeError(f"Invalid file descriptor type: {type(file)}")
@@ -1,4 +1,12 @@
-from pdfgen.yaml import parse
+import io
+import logging
+import time
+from dataclasses import dataclass, field
+
+import pytest
+
+from pdfgen.pdf.objects import PDF, Margin, PageBreak, Paragraph, Sheet, Table, fast_from_dict
+from pdfgen.yaml import check_yaml_syntax, has_variables, init, load_variables, parse
 
 
 def test_parse():
@@ -6,5 +14,141 @@ def test_parse():
     print(p)
 
 
+def test_from_yaml_defaults():
+    sheet = Sheet.from_yaml({})
+
+    # missing keys fall back to the defaults and default factories
+    assert sheet == Sheet()
+    assert sheet.margin == Margin()
+    assert sheet.margin is not Sheet().margin
+
+
+def test_from_yaml_nested():
+    sheet = Sheet.from_yaml({"size": "A3", "margin": {"left": 8, "top": 4}})
+
+    assert sheet.size == "A3"
+    assert sheet.margin == Margin(left=8, right=16, top=4, bottom=16)
+
+
+def test_from_yaml_ignores_unknown_keys():
+    paragraph = Paragraph.from_yaml({"text": "Hello", "colour": "red", "parent": "pdf"})
+
+    assert paragraph.text == "Hello"
+    assert paragraph.parent is None
+
+
+def test_table_from_fields_skips_rows():
+    table = Table._from_fields({"border": True, "rows": [{"row": [{"cell": {"text": "A"}}]}]})
+
+    assert table.border
+    assert table.rows == []
+
+
+def test_parse_empty_elements(caplog):
+    spec = io.StringIO("pdf:\n  content:\n    - table:\n    - image:\n    - paragraph:\n    - page_break:\n")
+
+    with caplog.at_level(logging.WARNING):
+        pdf = parse(spec)
+
+    # only the page break is built without attributes, the rest is skipped
+    assert [type(element) for element in pdf.content] == [PageBreak]
+    assert caplog.text.count("Invalid yaml element") == 3
+
+
+def test_render_paragraph_without_parent():
+    pdf = PDF(content=[Paragraph(text="Hello")])
+
+    # only paragraphs placed on the page by the parser get the spacing
+    assert [type(flowable).__name__ for flowable in pdf.render()] == ["Paragraph"]
+
+
+def test_fast_from_dict_kw_only():
+    @fast_from_dict
+    @dataclass
+    class KeywordFirst:
+        a: int = field(default=1, kw_only=True)
+        b: int = 2
+
+    assert KeywordFirst.from_yaml({"b": 3}) == KeywordFirst(a=1, b=3)
+    assert KeywordFirst.from_yaml({"a": 4}) == KeywordFirst(a=4, b=2)
+
+
+def test_table_empty_elements():
+    table = Table.from_yaml({"rows": [{"row": [{"cell": None}, {"image": None}]}]})
+
+    # an empty cell is a default cell, an empty image is skipped
+    assert table.rows == [[Table.Cell(parent=table)]]
+
+
+def test_table_invalid_image():
+    with pytest.raises(TypeError, match="image of a table row"):
+        Table.from_yaml({"rows": [{"row": [{"image": "logo.png"}]}]})
+
+
+def test_load_variables(tmp_path):
+    spec = tmp_path / "spec.yaml"
+    spec.write_text("paragraph:\n  text: 'S/N: <serial_number> <missing>'\n", encoding="utf-8")
+
+    init(str(spec))
+    result = load_variables({"serial_number": r"12\34"})
+
+    # the value is inserted verbatim, unknown placeholders are kept
+    assert result == {"paragraph": {"text": r"S/N: 12\34 <missing>"}}
+
+
+def test_load_variables_raw_assigned(monkeypatch):
+    monkeypatch.setattr(init, "yaml_raw", "text: <name>\n", raising=False)
+
+    # the directly assigned file is split on first use
+    assert has_variables() == ["<name>"]
+    assert load_variables({"name": "value"}) == {"text": "value"}
+
+
+def test_check_yaml_syntax(tmp_path, caplog):
+    spec = tmp_path / "spec.yaml"
+    spec.write_text("paragraph:\n  text: '<serial number> <part-id> <valid>'\n", encoding="utf-8")
+
+    init(str(spec))
+
+    with caplog.at_level(logging.WARNING):
+        check_yaml_syntax()
+
+    assert "Syntax error in variable: <serial number>" in caplog.text
+    assert "Syntax error in variable: <part-id>" in caplog.text
+    assert "<valid>" not in caplog.text
+
+
+def test_check_yaml_syntax_markup(tmp_path, caplog):
+    spec = tmp_path / "spec.yaml"
+    spec.write_text(
+        "paragraph:\n  text: 'Hello <b>bold</b><br/><font name=\"Courier\">code</font><br />'\n",
+        encoding="utf-8",
+    )
+
+    init(str(spec))
+
+    with caplog.at_level(logging.WARNING):
+        check_yaml_syntax()
+
+    # reportlab paragraph markup is not a malformed variable
+    assert "Syntax error" not in caplog.text
+
+
+def test_check_yaml_syntax_unterminated(tmp_path, caplog):
+    spec = tmp_path / "spec.yaml"
+    spec.write_text("paragraph:\n  text: 'note <x" + " " * 5000 + "-" * 5000 + "!'\n", encoding="utf-8")
+
+    init(str(spec))
+
+    start = time.perf_counter()
+
+    with caplog.at_level(logging.WARNING):
+        check_yaml_syntax()
+
+    # a long unterminated run must not backtrack exponentially
+    assert time.perf_counter() - start < 1
+    assert "Syntax error" not in caplog.text
+
+
 if __name__ == '__main__':
     test_parse()